@@ -15,7 +15,7 @@ def main():
             exit(-1)
 
         po.format()
-        po.save(po_file)
+        po.save_if_modified(po_file)
 
 if __name__ == "__main__":
     main()
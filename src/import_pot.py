@@ -16,6 +16,9 @@ def main():
 
     print(f'pot file:\t{pot_file}')
 
+    # Index the pot once and share it between all po files
+    pot_key_dict = pot.get_key_dict()
+
     for po_file in po_files:
         try:
             po = sgpo.pofile(po_file)
@@ -25,12 +28,11 @@ def main():
             exit(-1)
 
         # Import and specific format
-        po.import_pot(pot)
-        po.sort()
+        po.import_pot(pot, pot_key_dict)
         po.format()
 
         # Save pot file
-        po.save(po_file)
+        po.save_if_modified(po_file)
 
 
 if __name__ == "__main__":
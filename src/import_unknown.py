@@ -21,7 +21,6 @@ def main():
 
     # Import and specific format
     pot.import_unknown(unknown)
-    pot.sort()
     pot.format()
 
     # Save pot file
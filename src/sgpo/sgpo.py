@@ -8,6 +8,11 @@ import polib
 
 Key_tuple = namedtuple('Key_tuple', ['msgctxt', 'msgid'])
 
+# Matches everything inside parentheses that are NOT escaped
+_MULTI_KEYS_PATTERN = re.compile(r"(?<!\\\\)\(([^)]+)\)(?!\\\\)")
+# Matches versioned file names such as 'unknown.24_1'
+_VERSIONED_FILENAME_PATTERN = re.compile(r".*\d+_\d+$")
+
 
 def pofile(filename: str) -> SgPo:
     return SgPo._from_file(filename)
@@ -31,6 +36,8 @@ class SgPo(polib.POFile):
         'Content-Transfer-Encoding': '8bit',
         'Plural-Forms': 'nplurals=1; plural=0;',
     }
+    # Keys whose value is taken over from the original metadata (the empty ones above)
+    _META_DATA_PASSTHROUGH_KEYS = tuple(key for key, value in META_DATA_BASE_DICT.items() if value == '')
 
     def __init__(self) -> None:
         super().__init__(self)
@@ -53,17 +60,19 @@ class SgPo(polib.POFile):
         po = polib.pofile(filename, wrapwidth=9999, chraset='utf-8', check_for_duplicates=True)
 
         instance.__dict__ = po.__dict__
-        for entry in po:
-            instance.append(entry)
+        # The parser has already rejected duplicates, so bypass the O(n) membership check of append().
+        instance.extend(po)
 
         return instance
 
     def import_unknown(self, unknown: SgPo) -> None:
         success_count = 0
+        my_key_dict = self.get_key_dict()
         print('\nImport unknown entry...')
         for unknown_entry in unknown:
             # unknown_entry.flags = ['New']  # For debugging.
-            my_entry = self.find_by_key(unknown_entry.msgctxt, unknown_entry.msgid)
+            unknown_key = self._po_entry_to_key_tuple(unknown_entry)
+            my_entry = my_key_dict.get(unknown_key)
 
             if my_entry is not None:
                 if my_entry.msgid == unknown_entry.msgid:
@@ -78,6 +87,7 @@ class SgPo(polib.POFile):
             else:
                 try:
                     self.append(unknown_entry)
+                    my_key_dict[unknown_key] = unknown_entry
                     print(f'\nNew entry added.')
                     print(f'\t\tmsgctxt "{unknown_entry.msgctxt}')
                     print(f'\t\tmsgid "{unknown_entry.msgid}')
@@ -92,11 +102,13 @@ class SgPo(polib.POFile):
     def import_mismatch(self, mismatch: SgPo) -> None:
         new_entry_count = 0
         modified_entry_count = 0
+        my_key_dict = self.get_key_dict()
 
         print('\nImport unknown entry...')
         for mismatch_entry in mismatch:
             # mismatch_entry.flags = ['Modified']  # For debugging.
-            my_entry = self.find_by_key(mismatch_entry.msgctxt, mismatch_entry.msgid)
+            mismatch_key = self._po_entry_to_key_tuple(mismatch_entry)
+            my_entry = my_key_dict.get(mismatch_key)
 
             if my_entry is not None:
                 if my_entry.msgid == mismatch_entry.msgid:
@@ -115,6 +127,7 @@ class SgPo(polib.POFile):
             else:
                 try:
                     self.append(mismatch_entry)
+                    my_key_dict[mismatch_key] = mismatch_entry
                     print(f'\nNew entry added.')
                     print(f'\t\tmsgctxt "{mismatch_entry.msgctxt}"')
                     print(f'\t\tmsgid "{mismatch_entry.msgid}"')
@@ -127,45 +140,59 @@ class SgPo(polib.POFile):
         print(f'{new_entry_count} entries added.')
         print(f'{modified_entry_count} entries modified.')
 
-    def import_pot(self, pot: SgPo) -> None:
+    def import_pot(self, pot: SgPo, pot_key_dict: dict | None = None) -> None:
+        """
+        Imports the entries of the pot into this po.
+        When importing the same pot into several po files, pass the result of pot.get_key_dict()
+        as pot_key_dict so that the pot is indexed only once.
+        """
         new_entry_count = 0
         modified_entry_count = 0
-        po_key_set = set(self.get_key_list())
-        pot_key_set = set(pot.get_key_list())
+        if pot_key_dict is None:
+            pot_key_dict = pot.get_key_dict()
 
-        diff_pot_only_key = pot_key_set - po_key_set
-        diff_po_only_key = po_key_set - pot_key_set
+        # Classify the entries of this po in a single walk.
+        my_key_dict = {}
+        obsolete_items = []
+        modified_items = []
+        for my_entry in self:
+            key = self._po_entry_to_key_tuple(my_entry)
+            pot_entry = pot_key_dict.get(key)
+            if pot_entry is None:
+                if key not in my_key_dict:
+                    obsolete_items.append((key, my_entry))
+            elif key.msgid is None and my_entry.msgid != pot_entry.msgid:
+                # Only entries whose key is the msgctxt alone can have a modified msgid.
+                modified_items.append((my_entry, pot_entry))
+            my_key_dict.setdefault(key, my_entry)
+
+        new_items = [(key, pot_entry) for key, pot_entry in pot_key_dict.items() if key not in my_key_dict]
 
         # Add new my_entry
-        print(f'\npot file only: {len(diff_pot_only_key)}')
-        for key in diff_pot_only_key:
+        print(f'\npot file only: {len(new_items)}')
+        for key, pot_entry in new_items:
             print(f'msgctxt:\t"{key.msgctxt}"\n'
                   f'  msgid:\t"{key.msgid}"\n')
 
-            self.append(pot.find_by_key(key.msgctxt, key.msgid))
+            self.append(pot_entry)
             new_entry_count += 1
 
         # Remove obsolete entry
-        print(f'\npo file only: {len(diff_po_only_key)}')
-        for key in diff_po_only_key:
+        print(f'\npo file only: {len(obsolete_items)}')
+        for key, entry in obsolete_items:
             print(f'msgctxt:\t"{key.msgctxt}"\n'
                   f'  msgid:\t"{key.msgid}"\n')
 
-            entry = self.find_by_key(key.msgctxt, key.msgid)
             entry.obsolete = True
 
         # Modified entry
-        for my_entry in self:
-            if not my_entry.msgctxt.endswith(':'):
-                pot_entry = pot.find_by_key(my_entry.msgctxt, None)
-
-                if pot_entry and (my_entry.msgid != pot_entry.msgid):
-                    print(f'msgctxt:\t{my_entry.msgctxt}\n'
-                          f'  msgid:\t{my_entry.msgid}\n')
-                    my_entry.previous_msgid = my_entry.msgid
-                    my_entry.msgid = pot_entry.msgid
-                    my_entry.flags = ['fuzzy']
-                    modified_entry_count += 1
+        for my_entry, pot_entry in modified_items:
+            print(f'msgctxt:\t{my_entry.msgctxt}\n'
+                  f'  msgid:\t{my_entry.msgid}\n')
+            my_entry.previous_msgid = my_entry.msgid
+            my_entry.msgid = pot_entry.msgid
+            my_entry.flags = ['fuzzy']
+            modified_entry_count += 1
 
         print(f'\n     new entry:\t{new_entry_count}')
         print(f'\nmodified entry:\t{modified_entry_count}')
@@ -180,22 +207,19 @@ class SgPo(polib.POFile):
                 entry.comment = None
 
     def find_by_key(self, msgctxt: str, msgid: str) -> polib.POEntry:
-        for entry in self:
-            # If the msgctxt ends with ':', the combination of msgid and
-            # msgctxt becomes the key that identifies the entry.
-            # Otherwise, only msgctxt is the key to identify the entry.
-            if entry.msgctxt.endswith(':'):
-                if entry.msgctxt == msgctxt and entry.msgid == msgid:
-                    return entry
-            else:
-                if entry.msgctxt == msgctxt:
-                    return entry
-
-        return None
+        # If the msgctxt ends with ':', the combination of msgid and
+        # msgctxt becomes the key that identifies the entry.
+        # Otherwise, only msgctxt is the key to identify the entry.
+        # A matching entry has the same msgctxt, so the suffix is checked once on the argument.
+        if msgctxt is not None and msgctxt.endswith(':'):
+            return next((entry for entry in self if entry.msgctxt == msgctxt and entry.msgid == msgid), None)
+        else:
+            return next((entry for entry in self if entry.msgctxt == msgctxt), None)
 
     def sort(self, *, key=None, reverse=False):
         if key is None:
-            super().sort(key=lambda entry: (self._po_entry_to_sort_key(entry)), reverse=reverse)
+            # list.sort() computes each key exactly once, so pass the bound method without a lambda wrapper.
+            super().sort(key=self._po_entry_to_sort_key, reverse=reverse)
         else:
             super().sort(key=key, reverse=reverse)
 
@@ -207,21 +231,54 @@ class SgPo(polib.POFile):
         # Change the default value of newline to \n (LF).
         super().save(fpath=fpath, repr_method=repr_method, newline=newline)
 
+    def save_if_modified(self, fpath=None) -> bool:
+        """
+        Saves the file only if the content differs from the file already on disk.
+        Returns True if the file has been written.
+        """
+        if self.fpath is None and fpath is None:
+            raise IOError('You must provide a file path to save() method')
+        if fpath is None:
+            fpath = self.fpath
+        contents = self.__unicode__()
+
+        try:
+            with open(fpath, 'r', encoding=self.encoding, newline='') as file:
+                if file.read() == contents:
+                    return False
+        except FileNotFoundError:
+            pass
+
+        # Same output as save(), without serializing the entries a second time.
+        with open(fpath, 'w', encoding=self.encoding, newline='\n') as file:
+            file.write(contents)
+        if self.fpath is None:
+            self.fpath = fpath
+
+        return True
+
     def get_key_list(self) -> list:
         return [self._po_entry_to_key_tuple(entry) for entry in self]
 
+    def get_key_dict(self) -> dict:
+        """
+        Returns a dict that maps the key of each entry to the entry itself.
+        If several entries share a key, the first one wins, as with find_by_key().
+        """
+        key_dict = {}
+        for entry in self:
+            key_dict.setdefault(self._po_entry_to_key_tuple(entry), entry)
+        return key_dict
+
     # ======= Private methods =======
     @staticmethod
     def _filter_po_metadata(meta_dict: dict) -> dict:
         """
         By reconstructing the metadata, only the predefined metadata is preserved.
         """
-        new_meta_dict = {}
-        for meta_key, meta_value in SgPo.META_DATA_BASE_DICT.items():
-            if meta_value == '':
-                new_meta_dict[meta_key] = meta_dict.get(meta_key, '')
-            else:
-                new_meta_dict[meta_key] = meta_value
+        new_meta_dict = SgPo.META_DATA_BASE_DICT.copy()
+        for meta_key in SgPo._META_DATA_PASSTHROUGH_KEYS:
+            new_meta_dict[meta_key] = meta_dict.get(meta_key, '')
         return new_meta_dict
 
     def _po_entry_to_sort_key(self, po_entry: polib.POEntry) -> str:
@@ -230,11 +287,12 @@ class SgPo(polib.POFile):
         Entries starting with a '*' are greeted with a character of ASCII code 1 at the beginning to be placed at the start of the file.
         Keys other than these are further rewritten through a key filter.
         """
+        legacy_key = self._po_entry_to_legacy_key(po_entry)
         if po_entry.msgctxt.startswith('*'):
             # Add a character with an ASCII code of 1 at the beginning to make the sort order come first.
-            return chr(1) + self._po_entry_to_legacy_key(po_entry)
+            return '\x01' + legacy_key
         else:
-            return self._multi_keys_filter(self._po_entry_to_legacy_key(po_entry))
+            return self._multi_keys_filter(legacy_key)
 
     @staticmethod
     def _po_entry_to_legacy_key(po_entry: polib.POEntry) -> str:
@@ -256,10 +314,12 @@ class SgPo(polib.POFile):
         Rewrite the string to be sorted to group the multi keys entries together in the appropriate position in the locale file.
         """
 
-        pattern = r"(?<!\\\\)\(([^)]+)\)(?!\\\\)"  # Matches everything inside parentheses that are NOT escaped
+        # Most keys contain no parentheses at all, so skip the regex for them.
+        if '(' not in text:
+            return text
 
-        # Use re.sub to add 'ZZZ' and remove parentheses from any matched pattern
-        modified_text = re.sub(pattern, 'ZZZ\\1', text)
+        # Add 'ZZZ' and remove parentheses from any matched pattern
+        modified_text = _MULTI_KEYS_PATTERN.sub('ZZZ\\1', text)
 
         return modified_text
 
@@ -272,8 +332,7 @@ class SgPo(polib.POFile):
         if not os.path.exists(filename):
             raise FileNotFoundError(f"File not found: {filename}")
 
-        pattern = r".*\d+_\d+$"
-        if not (filename.endswith('.po') or filename.endswith('pot') or re.match(pattern, filename)):
+        if not (filename.endswith(('.po', '.pot')) or _VERSIONED_FILENAME_PATTERN.match(filename)):
             raise ValueError("File type not supported")
 
         return True
@@ -32,8 +32,6 @@ def optimize_po_entry(po_entry: polib.POEntry) -> polib.POEntry:
     original_text = '"' + po_entry.msgid + '"'
     if po_entry.msgctxt.endswith(original_text):
         new_po_entry.msgctxt = po_entry.msgctxt[: -len(original_text)] + ':'
-    else:
-        new_po_entry.msgctxt = po_entry.msgctxt
 
     return new_po_entry
 
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 import sgpo
@@ -60,6 +61,13 @@ class TestSgpo(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(expected_msgstr, result.msgstr)
 
+    def test_find_by_key_sgpo_none_msgctxt(self):
+        po_file = get_test_data_path('common', 'language.po')
+        po = sgpo.pofile(po_file)
+        result = po.find_by_key(None, 'msgid_2')
+
+        self.assertIsNone(result)
+
     def test_sort_sgpo(self):
         normal_po_file = get_test_data_path('sort', 'normal_order.po')
         reverse_po_file = get_test_data_path('sort', 'reverse_order.po')
@@ -136,6 +144,30 @@ class TestSgpo(unittest.TestCase):
 
         self.assertEqual(po.__unicode__(), abnormal_order_header_po.__unicode__())
 
+    def test_save_if_modified_sgpo(self):
+        po_file = get_test_data_path('format', 'formatted.po')
+        po = sgpo.pofile(po_file)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            saved_file = os.path.join(tmp_dir, 'saved.po')
+            written_file = os.path.join(tmp_dir, 'written.po')
+            po.save(saved_file)
+
+            self.assertTrue(po.save_if_modified(written_file))
+            self.assertFalse(po.save_if_modified(written_file))
+
+            with open(saved_file, 'rb') as saved, open(written_file, 'rb') as written:
+                self.assertEqual(saved.read(), written.read())
+
+            po.find_by_key('unique_key_1', None).msgstr = 'modified'
+            self.assertTrue(po.save_if_modified(written_file))
+
+    def test_save_if_modified_sgpo_without_path(self):
+        po = sgpo.pofile_from_text(get_key_list_test_data)
+
+        with self.assertRaises(IOError):
+            po.save_if_modified()
+
     def test_get_key_list_sgpo(self):
         pot = sgpo.pofile_from_text(get_key_list_test_data)
         result = pot.get_key_list()
@@ -144,6 +176,16 @@ class TestSgpo(unittest.TestCase):
 
         self.assertEqual(expected_key_list, result)
 
+    def test_get_key_dict_sgpo(self):
+        pot = sgpo.pofile_from_text(get_key_list_test_data)
+        result = pot.get_key_dict()
+
+        print(f"\n{result}")
+
+        self.assertEqual(expected_key_list, list(result.keys()))
+        for key, entry in result.items():
+            self.assertIs(entry, pot.find_by_key(key.msgctxt, key.msgid))
+
     def test_import_unknown_sgpo_case1(self):
         """
         No conflict between the pot file and the unknown file
@@ -274,6 +316,28 @@ class TestSgpo(unittest.TestCase):
 
         self.assertEqual(expected_result.__unicode__(), po.__unicode__())
 
+    def test_import_pot_sgpo_shared_pot_key_dict(self):
+        """
+        The same pot is imported into several po files through one key dict.
+        """
+        pot_file = get_test_data_path('import_pot', 'case_4_messages.pot')
+        pot = sgpo.pofile(pot_file)
+        pot_key_dict = pot.get_key_dict()
+
+        for locale_code in ('ja_JP', 'zh_CN'):
+            po_file = get_test_data_path('import_pot', f'case_4_{locale_code}.po')
+            expected_result_file = get_test_data_path('import_pot', f'case_4_{locale_code}_expected_result.po')
+
+            po = sgpo.pofile(po_file)
+            expected_result = sgpo.pofile(expected_result_file)
+
+            po.import_pot(pot, pot_key_dict)
+            po.sort()
+            print(f"\n======== New {locale_code} po content ========\n")
+            print(po)
+
+            self.assertEqual(expected_result.__unicode__(), po.__unicode__())
+
     def test_delete_extracted_comments(self):
         pot_file = get_test_data_path('delete_extracted_comments', 'messages.pot')
         expected_result_file = get_test_data_path('delete_extracted_comments', 'expected_result.pot')